@@ -9,19 +9,264 @@ Date: November 12, 2025
 """
 
 import argparse
+import itertools
+import json
+import os
+import random
 import re
 import sys
+import threading
 import time
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import requests
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
-from nba_api.stats.endpoints import shotchartdetail, commonallplayers
+from nba_api.stats.endpoints import shotchartdetail, commonallplayers, leaguedashplayerstats
+from nba_api.stats.library.http import NBAStatsHTTP, STATS_HEADERS
 from nba_api.stats.static import teams
 
 
+# nba_api sends "Cache-Control: no-cache" by default, which would make the
+# local HTTP cache bypass every stored response
+REQUEST_HEADERS = {
+    key: value
+    for key, value in STATS_HEADERS.items()
+    if key not in ('Cache-Control', 'Pragma')
+}
+
+# Ask for compressed responses, but only in encodings the installed urllib3
+# can decode: nba_api always advertises brotli, which needs an optional package
+REQUEST_HEADERS['Accept-Encoding'] = requests.utils.DEFAULT_ACCEPT_ENCODING
+
+# Expected season format, e.g. "2024-25"
+SEASON_PATTERN = re.compile(r'^\d{4}-\d{2}$')
+
+# Arrow schema for the ShotChartDetail result set: low-cardinality strings are
+# dictionary-encoded so each distinct value is stored once per batch, and
+# small-valued integers use fixed narrow widths
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+SHOT_SCHEMA = pa.schema([
+    ('GRID_TYPE', _CATEGORY),
+    ('GAME_ID', pa.string()),
+    ('GAME_EVENT_ID', pa.int64()),
+    ('PLAYER_ID', pa.int64()),
+    ('PLAYER_NAME', _CATEGORY),
+    ('TEAM_ID', pa.int64()),
+    ('TEAM_NAME', _CATEGORY),
+    ('PERIOD', pa.int8()),
+    ('MINUTES_REMAINING', pa.int64()),
+    ('SECONDS_REMAINING', pa.int64()),
+    ('EVENT_TYPE', _CATEGORY),
+    ('ACTION_TYPE', _CATEGORY),
+    ('SHOT_TYPE', _CATEGORY),
+    ('SHOT_ZONE_BASIC', _CATEGORY),
+    ('SHOT_ZONE_AREA', _CATEGORY),
+    ('SHOT_ZONE_RANGE', _CATEGORY),
+    ('SHOT_DISTANCE', pa.int16()),
+    ('LOC_X', pa.int16()),
+    ('LOC_Y', pa.int16()),
+    ('SHOT_ATTEMPTED_FLAG', pa.int64()),
+    ('SHOT_MADE_FLAG', pa.int64()),
+    ('GAME_DATE', _CATEGORY),
+    ('HTM', _CATEGORY),
+    ('VTM', _CATEGORY),
+])
+
+
+class RateLimiter:
+    """
+    Thread-safe adaptive limiter that spaces API requests `interval` seconds apart.
+    
+    Each caller reserves the next free time slot under a lock and then sleeps
+    until that slot arrives, so worker threads can overlap request latency
+    without exceeding the overall request rate. The interval adapts to the
+    API: it doubles once per burst of throttled or failed requests and shrinks
+    by 20% after `speedup_after` consecutive successes.
+    
+    Parameters:
+    -----------
+    interval : float
+        Initial time between consecutive requests, in seconds
+    min_interval : float
+        Shortest allowed interval (default: 0.2 seconds, i.e. 5 requests/second)
+    max_interval : float
+        Longest allowed interval (default: 10 seconds)
+    speedup_after : int
+        Consecutive successes required before speeding up (default: 10)
+    """
+    
+    def __init__(self, interval, min_interval=0.2, max_interval=10.0, speedup_after=10):
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup_after = speedup_after
+        self._next_slot = 0.0
+        self._last_backoff = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Block until the caller is allowed to issue its next request.
+        
+        Returns:
+        --------
+        float
+            Time slot (from time.monotonic) at which the request goes out
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        
+        return slot
+    
+    def record_success(self):
+        """
+        Note a successful request, speeding up after enough in a row.
+        """
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.speedup_after:
+                if self.interval > self.min_interval:
+                    self.interval = max(self.interval / 1.25, self.min_interval)
+                self._successes = 0
+    
+    def record_failure(self, issued_at, retry_after=None):
+        """
+        Note a throttled or failed request, slowing down and pausing all callers.
+        
+        Requests issued before the most recent backoff belong to the same burst
+        and were already accounted for, so their failures do not slow down
+        the limiter again.
+        
+        Parameters:
+        -----------
+        issued_at : float
+            Time slot returned by `acquire` for the failed request
+        retry_after : float, optional
+            Server-requested wait in seconds; defaults to the new interval
+        """
+        with self._lock:
+            self._successes = 0
+            if issued_at < self._last_backoff:
+                return
+            
+            self.interval = min(self.interval * 2, self.max_interval)
+            self._last_backoff = time.monotonic()
+            
+            backoff = self.interval if retry_after is None else retry_after
+            self._next_slot = max(self._next_slot, time.monotonic() + backoff)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP adapter that acquires a RateLimiter before each request hits the network.
+    
+    Responses served from the local HTTP cache never reach the adapter, so
+    cached reruns are not slowed down by rate limiting. Every network response
+    is reported back to the limiter: 429s, 5xx errors, connection failures and
+    non-JSON pages served with a success status slow it down, anything else
+    counts as a success.
+    
+    Parameters:
+    -----------
+    rate_limiter : RateLimiter
+        Shared limiter acquired before every outgoing request
+    """
+    
+    def __init__(self, rate_limiter, **kwargs):
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+    
+    def send(self, request, **kwargs):
+        issued_at = self.rate_limiter.acquire()
+        
+        try:
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            self.rate_limiter.record_failure(issued_at)
+            raise
+        
+        if response.status_code == 429 or response.status_code >= 500:
+            # Retry-After may also be an HTTP date; only the seconds form is honoured
+            retry_after = response.headers.get('Retry-After', '')
+            self.rate_limiter.record_failure(
+                issued_at,
+                float(retry_after) if retry_after.isdigit() else None
+            )
+        elif response.ok and not is_json_response(response):
+            # Throttle pages are sometimes served with status 200
+            self.rate_limiter.record_failure(issued_at)
+        else:
+            self.rate_limiter.record_success()
+        
+        return response
+
+
+def is_json_response(response):
+    """
+    Check whether an HTTP response body parses as JSON.
+    
+    stats.nba.com sometimes answers with a throttle or error page that still
+    has status 200, so the status code alone does not mean the data is usable.
+    
+    Parameters:
+    -----------
+    response : requests.Response
+        Response to inspect
+    
+    Returns:
+    --------
+    bool
+        True if the body is valid JSON
+    """
+    try:
+        response.json()
+    except ValueError:
+        return False
+    return True
+
+
+def install_http_cache(cache_path, expire_after=timedelta(days=7)):
+    """
+    Route all nba_api requests through a persistent on-disk HTTP cache.
+    
+    Only responses with a JSON body are cached, so a throttle or error page
+    is never replayed to later retries or reruns.
+    
+    Parameters:
+    -----------
+    cache_path : str or Path
+        Path of the SQLite cache file (".sqlite" is appended)
+    expire_after : timedelta
+        How long cached responses stay valid (default: 7 days)
+    """
+    session = requests_cache.CachedSession(
+        str(cache_path),
+        expire_after=expire_after,
+        allowable_methods=('GET',),
+        filter_fn=is_json_response
+    )
+    NBAStatsHTTP.set_session(session)
+
+
 def get_player_list(season):
     """
-    Fetch all active player IDs for a given season.
+    Fetch active player IDs for a given season, limited to 3-point shooters.
+    
+    Players without a single 3-point attempt are dropped up front using one
+    league-wide stats request, which saves a shot chart request per player.
     
     Parameters:
     -----------
@@ -39,27 +284,71 @@ def get_player_list(season):
     # Season format for API: "2022-23"
     players_data = commonallplayers.CommonAllPlayers(
         season=season,
-        is_only_current_season=1  # Only active players in this season
+        is_only_current_season=1,  # Only active players in this season
+        headers=REQUEST_HEADERS
+    ).get_data_frames()[0]
+    
+    # Query season totals for every player in one request
+    player_stats = leaguedashplayerstats.LeagueDashPlayerStats(
+        season=season,
+        headers=REQUEST_HEADERS
     ).get_data_frames()[0]
+    shooter_ids = player_stats.loc[player_stats['FG3A'] > 0, 'PLAYER_ID']
     
-    # Filter to only include players (exclude teams)
-    active_players = players_data[players_data['ROSTERSTATUS'] == 1].copy()
+    # Filter to only include players (exclude teams) who attempted a 3-pointer
+    active_players = players_data[
+        (players_data['ROSTERSTATUS'] == 1) & players_data['PERSON_ID'].isin(shooter_ids)
+    ]
     
+    # Zip the raw columns rather than materializing a Series per row
     player_list = [
         {
-            'player_id': row['PERSON_ID'],
-            'player_name': row['DISPLAY_FIRST_LAST']
+            'player_id': player_id,
+            'player_name': player_name
         }
-        for _, row in active_players.iterrows()
+        for player_id, player_name in zip(
+            active_players['PERSON_ID'].to_numpy(),
+            active_players['DISPLAY_FIRST_LAST'].to_numpy()
+        )
     ]
     
-    print(f"Found {len(player_list)} active players")
+    print(f"Found {len(player_list)} active players with 3-point attempts")
     return player_list
 
 
-def get_player_shots(player_id, player_name, season):
+def build_shot_batch(headers, rows):
     """
-    Fetch all shot attempts for a specific player in a given season.
+    Build an Arrow record batch from raw ShotChartDetail rows.
+    
+    Parameters:
+    -----------
+    headers : list of str
+        Column names of the result set
+    rows : list of list
+        Row values in the same order as `headers`
+    
+    Returns:
+    --------
+    pa.RecordBatch
+        Batch following SHOT_SCHEMA
+    """
+    if not rows:
+        return pa.RecordBatch.from_pylist([], schema=SHOT_SCHEMA)
+    
+    # Transpose rows into columns and convert each one straight to Arrow
+    columns = dict(zip(headers, zip(*rows)))
+    return pa.record_batch(
+        [pa.array(columns[field.name], type=field.type) for field in SHOT_SCHEMA],
+        schema=SHOT_SCHEMA
+    )
+
+
+def get_player_shots(player_id, player_name, season, max_attempts=5):
+    """
+    Fetch all 3-point attempts for a specific player in a given season.
+    
+    Transient failures (connection errors, timeouts and non-JSON error pages)
+    are retried with exponential backoff and jitter.
     
     Parameters:
     -----------
@@ -69,112 +358,327 @@ def get_player_shots(player_id, player_name, season):
         Player's full name (for logging purposes)
     season : str
         NBA season in format "2022-23"
+    max_attempts : int
+        Number of tries before giving up on transient errors (default: 5)
     
     Returns:
     --------
-    pd.DataFrame
-        DataFrame containing shot chart data, or empty DataFrame if no data
+    pa.RecordBatch or None
+        Batch containing 3-point shot chart data (empty if the player took no
+        3-point attempts), or None if the data could not be fetched
+    
+    Raises:
+    -------
+    ValueError
+        If max_attempts is less than 1
     """
-    try:
-        # Fetch shot chart details
-        shot_data = shotchartdetail.ShotChartDetail(
-            team_id=0,  # 0 fetches all teams
-            player_id=player_id,
-            season_nullable=season,
-            season_type_all_star='Regular Season',
-            context_measure_simple='FGA'  # Field Goal Attempts
-        )
-        
-        # Get the shot data DataFrame
-        shots_df = shot_data.get_data_frames()[0]
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+    
+    for attempt in range(max_attempts):
+        try:
+            # Fetch shot chart details
+            shot_data = shotchartdetail.ShotChartDetail(
+                team_id=0,  # 0 fetches all teams
+                player_id=player_id,
+                season_nullable=season,
+                season_type_all_star='Regular Season',
+                context_measure_simple='FG3A',  # 3-Point Field Goal Attempts only
+                headers=REQUEST_HEADERS
+            )
+            
+            # Convert the raw result set directly, skipping pandas entirely
+            # (the rows already include a PLAYER_NAME column)
+            result_set = shot_data.shot_chart_detail.get_dict()
+            return build_shot_batch(result_set['headers'], result_set['data'])
         
-        if not shots_df.empty:
-            # Add player name for reference
-            shots_df['PLAYER_NAME'] = player_name
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            error = e
+            # Exponential backoff with jitter before trying again
+            if attempt < max_attempts - 1:
+                time.sleep(2 ** attempt + random.random())
         
-        return shots_df
+        except Exception as e:
+            error = e
+            break
     
-    except Exception as e:
-        print(f"  ⚠️  Error fetching data for {player_name} (ID: {player_id}): {str(e)}")
-        return pd.DataFrame()
+    print(f"  ⚠️  Error fetching data for {player_name} (ID: {player_id}): {str(error)}")
+    return None
 
 
-def fetch_three_point_data(season="2022-23", rate_limit_seconds=0.6):
+def load_checkpoint(checkpoint_path, output_path):
+    """
+    Load the IDs of players already saved by an interrupted run.
+    
+    The checkpoint is only trusted if the Parquet file it belongs to exists
+    and is readable; otherwise the scrape starts over. IDs are recorded as
+    soon as a batch is handed to the writer, before the output file is
+    finalized, so only IDs that actually have rows in the output are kept.
+    Players without any 3-point attempts are therefore fetched again.
+    
+    Parameters:
+    -----------
+    checkpoint_path : str or Path
+        Checkpoint file with one completed player ID per line
+    output_path : str or Path
+        Parquet file written by the interrupted run
+    
+    Returns:
+    --------
+    set of int
+        Player IDs that do not need to be fetched again
+    """
+    checkpoint_path = Path(checkpoint_path)
+    output_path = Path(output_path)
+    
+    if not checkpoint_path.exists() or not output_path.exists():
+        return set()
+    
+    try:
+        saved_ids = pq.read_table(output_path, columns=['PLAYER_ID'])['PLAYER_ID']
+    except (OSError, pa.ArrowInvalid):
+        print(f"⚠️  Existing output {output_path} is unreadable, ignoring checkpoint")
+        return set()
+    
+    with open(checkpoint_path) as f:
+        checkpoint_ids = {int(line) for line in f if line.strip()}
+    
+    # A run killed before replacing its output leaves the checkpoint ahead of the data
+    return checkpoint_ids & set(pc.unique(saved_ids).to_pylist())
+
+
+def append_checkpoint(checkpoint_file, player_id):
+    """
+    Record a completed player ID in the checkpoint file.
+    
+    The line is flushed but not fsynced: a player's rows only become durable
+    when the output file is replaced, and load_checkpoint cross-checks every
+    ID against that file anyway.
+    
+    Parameters:
+    -----------
+    checkpoint_file : file object
+        Checkpoint file opened for appending
+    player_id : int
+        NBA player ID to record
+    """
+    checkpoint_file.write(f"{player_id}\n")
+    checkpoint_file.flush()
+
+
+def read_checkpointed_batches(output_path, player_ids):
+    """
+    Read back rows of previously saved players from an existing Parquet file.
+    
+    Rows of players missing from the checkpoint (e.g. written just before a
+    crash but never recorded) are dropped, since those players are fetched
+    again.
+    
+    Parameters:
+    -----------
+    output_path : str or Path
+        Parquet file written by the interrupted run
+    player_ids : set of int
+        Player IDs recorded in the checkpoint
+    
+    Yields:
+    -------
+    pa.RecordBatch
+        Non-empty batch with one row group of previously saved 3-point attempts
+    """
+    value_set = pa.array(sorted(player_ids), type=pa.int64())
+    parquet_file = pq.ParquetFile(output_path)
+    
+    # Yield whole row groups, which only ever contain complete players, so an
+    # interrupted copy cannot carry over part of a player's rows
+    for index in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(index)
+        table = table.filter(pc.is_in(table['PLAYER_ID'], value_set=value_set))
+        if table.num_rows:
+            yield table.combine_chunks().to_batches()[0]
+
+
+def fetch_three_point_data(season="2022-23", rate_limit_seconds=0.6, max_workers=8,
+                           checkpoint_path=None, skip_player_ids=None):
     """
     Main function to fetch all 3-point attempts for a season.
     
+    Player batches are yielded as soon as they arrive so the caller can write
+    them out incrementally instead of holding the whole season in memory.
+    
+    If `checkpoint_path` is given, each player's ID is appended to it once the
+    caller has consumed that player's batch, so an interrupted scrape can be
+    resumed by passing the recorded IDs back as `skip_player_ids`. The
+    checkpoint is removed after a run in which no player failed.
+    
     Parameters:
     -----------
     season : str
         NBA season in format "2022-23"
     rate_limit_seconds : float
         Time to wait between API requests (default: 0.6 seconds)
+    max_workers : int
+        Number of concurrent request threads (default: 8)
+    checkpoint_path : str or Path, optional
+        File recording the IDs of players already saved
+    skip_player_ids : set of int, optional
+        Player IDs saved by a previous run, which are not fetched again
     
-    Returns:
-    --------
-    pd.DataFrame
-        Combined DataFrame with all 3-point attempts
+    Yields:
+    -------
+    pa.RecordBatch
+        Non-empty batch with one player's 3-point attempts
     """
     print(f"\n{'='*60}")
     print(f"NBA 3-Point Data Collection Pipeline")
     print(f"Season: {season}")
     print(f"{'='*60}\n")
     
+    # Rate limiting - be polite to the API. The limiter sits on the HTTP
+    # session so only requests that actually hit the network are throttled
+    rate_limiter = RateLimiter(rate_limit_seconds)
+    adapter = RateLimitedAdapter(rate_limiter, pool_maxsize=max_workers)
+    NBAStatsHTTP.get_session().mount('https://', adapter)
+    
     # Step 1: Get all active players
     player_list = get_player_list(season)
     
+    # Skip players already saved by an interrupted run
+    skip_player_ids = skip_player_ids or set()
+    if skip_player_ids:
+        player_list = [p for p in player_list if p['player_id'] not in skip_player_ids]
+        print(f"Resuming: {len(skip_player_ids)} players already saved")
+    
     # Step 2: Fetch shots for each player
-    all_three_pointers = []
+    total_attempts = 0
+    failed_players = []
     
     print(f"\nFetching shot data for {len(player_list)} players...")
     print("(This may take a while due to rate limiting)\n")
     
-    for player in tqdm(player_list, desc="Progress", unit="player"):
-        player_id = player['player_id']
-        player_name = player['player_name']
-        
-        # Fetch shot data
-        shots_df = get_player_shots(player_id, player_name, season)
+    # Start a fresh checkpoint unless resuming from an existing one
+    checkpoint_file = None
+    if checkpoint_path is not None:
+        checkpoint_file = open(checkpoint_path, 'a' if skip_player_ids else 'w')
+    
+    # Requests are I/O-bound, so worker threads overlap network latency while
+    # the shared limiter keeps the overall request rate within the API's limits
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(
+                get_player_shots,
+                player['player_id'],
+                player['player_name'],
+                season
+            ): player
+            for player in player_list
+        }
         
-        # Filter for 3-point attempts only
-        if not shots_df.empty:
-            # Filter where SHOT_TYPE contains '3PT'
-            three_pointers = shots_df[shots_df['SHOT_TYPE'] == '3PT Field Goal'].copy()
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Progress", unit="player"):
+            # Fetch shot data
+            shots = future.result()
             
-            if not three_pointers.empty:
-                all_three_pointers.append(three_pointers)
-        
-        # Rate limiting - be polite to the API
-        time.sleep(rate_limit_seconds)
-    
-    # Step 3: Combine all data
-    if all_three_pointers:
-        combined_df = pd.concat(all_three_pointers, ignore_index=True)
-        print(f"\n✓ Successfully collected {len(combined_df):,} three-point attempts")
-        return combined_df
+            if shots is None:
+                failed_players.append(futures[future])
+                continue
+            
+            # The API already filtered to 3-point attempts
+            if shots.num_rows:
+                total_attempts += shots.num_rows
+                yield shots
+            
+            # Execution only resumes here once the caller has taken the batch;
+            # load_checkpoint ignores IDs whose rows never reached the output
+            if checkpoint_file is not None:
+                append_checkpoint(checkpoint_file, futures[future]['player_id'])
+    finally:
+        # Drop queued requests if the consumer stops early (e.g. Ctrl-C)
+        executor.shutdown(wait=True, cancel_futures=True)
+        if checkpoint_file is not None:
+            checkpoint_file.close()
+    
+    # Keep the checkpoint if players failed, so a rerun only retries those
+    if checkpoint_path is not None and not failed_players:
+        Path(checkpoint_path).unlink(missing_ok=True)
+    
+    # Step 3: Report totals
+    if total_attempts:
+        print(f"\n✓ Successfully collected {total_attempts:,} three-point attempts")
     else:
         print("\n⚠️  No three-point attempts found")
-        return pd.DataFrame()
+    
+    # List players whose data is missing so the gap is visible and reproducible
+    if failed_players:
+        print(f"\n⚠️  Dropped {len(failed_players)} players after retries:")
+        for player in failed_players:
+            print(f"  - {player['player_name']} (ID: {player['player_id']})")
 
 
-def save_to_parquet(df, output_path):
+def save_to_parquet(batches, output_path, row_group_size=4096):
     """
-    Save DataFrame to Parquet file format.
+    Stream Arrow record batches into a single Parquet file.
+    
+    The writer is opened lazily with the schema of the first batch. Batches
+    are buffered until about `row_group_size` rows have arrived and then
+    written as one row group. The default of a few thousand rows, a small
+    fraction of a season's ~90k attempts, keeps peak memory close to a
+    handful of players while avoiding one tiny row group per player; larger
+    values compress slightly better at the cost of buffering more rows.
+    
+    Batches go to a temporary file that replaces `output_path` once the
+    writer is closed, so an existing file can be read back as one of the
+    inputs. No file is created if `batches` yields nothing.
     
     Parameters:
     -----------
-    df : pd.DataFrame
-        DataFrame to save
+    batches : iterable of pa.RecordBatch
+        Record batches to save, all sharing the same schema
     output_path : str or Path
         Path where the Parquet file will be saved
+    row_group_size : int
+        Number of rows to buffer before writing a row group (default: 4096)
+    
+    Returns:
+    --------
+    int
+        Total number of rows written
     """
     # Ensure the output directory exists
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Save as Parquet
-    df.to_parquet(output_path, engine='pyarrow', index=False)
-    print(f"✓ Data saved to: {output_path}")
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+    writer = None
+    buffer = []
+    buffered_rows = 0
+    total_rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pq.ParquetWriter(temp_path, batch.schema, compression='zstd')
+            
+            buffer.append(batch)
+            buffered_rows += batch.num_rows
+            total_rows += batch.num_rows
+            
+            # Write one row group per ~row_group_size rows, not one per player
+            if buffered_rows >= row_group_size:
+                writer.write_table(pa.Table.from_batches(buffer), row_group_size=buffered_rows)
+                buffer = []
+                buffered_rows = 0
+    finally:
+        # Closing writes the footer, so whatever was fetched stays readable
+        if writer is not None:
+            if buffer:
+                writer.write_table(pa.Table.from_batches(buffer), row_group_size=buffered_rows)
+            writer.close()
+            os.replace(temp_path, output_path)
+    
+    if writer is not None:
+        print(f"✓ Data saved to: {output_path}")
+    
+    return total_rows
 
 
 def validate_season_format(season):
@@ -196,8 +700,7 @@ def validate_season_format(season):
     argparse.ArgumentTypeError
         If the season format is invalid
     """
-    pattern = r'^\d{4}-\d{2}$'
-    if not re.match(pattern, season):
+    if not SEASON_PATTERN.match(season):
         raise argparse.ArgumentTypeError(
             f"Invalid season format: '{season}'. Expected format: 'YYYY-YY' (e.g., '2024-25')"
         )
@@ -261,16 +764,29 @@ def main():
     season_filename = season.replace('-', '_')
     output_path = Path(__file__).parent.parent / "data" / "raw" / f"nba_3pt_{season_filename}.parquet"
     
-    # Fetch the data
-    three_point_df = fetch_three_point_data(season=season)
+    # Cache API responses on disk so reruns skip the network entirely
+    install_http_cache(Path(__file__).parent.parent / ".nba_api_cache")
     
-    # Save to Parquet if data was collected
-    if not three_point_df.empty:
-        save_to_parquet(three_point_df, output_path)
-        
+    # Resume from a previous interrupted run if its checkpoint is still valid
+    checkpoint_path = output_path.with_suffix('.ckpt')
+    saved_player_ids = load_checkpoint(checkpoint_path, output_path)
+    
+    # Fetch the data, writing each player's shots to Parquet as they arrive
+    batches = fetch_three_point_data(
+        season=season,
+        checkpoint_path=checkpoint_path,
+        skip_player_ids=saved_player_ids
+    )
+    if saved_player_ids:
+        # Carry over the rows already saved for checkpointed players
+        batches = itertools.chain(read_checkpointed_batches(output_path, saved_player_ids), batches)
+    
+    total_attempts = save_to_parquet(batches, output_path)
+    
+    if total_attempts:
         print(f"\n{'='*60}")
         print(f"Pipeline Complete!")
-        print(f"Total 3-point attempts collected: {len(three_point_df):,}")
+        print(f"Total 3-point attempts collected: {total_attempts:,}")
         print(f"Output file: {output_path}")
         print(f"{'='*60}\n")
     else: